@@ -1,11 +1,30 @@
-from .utils import _cpw_info
+from .utils import _core_clad, _cpw_info, _sorted_ports
 
 import photonforge as _pf
+import numpy as _np
 
 import warnings as _warn
 import typing as _typ
 
 
+_unsupported_technology_warning = (
+    "Current default technology %s does not seem supported by the Luxtelligence LNOI400 "
+    "component library."
+)
+
+
+def _get_technology(technology):
+    if technology is None:
+        technology = _pf.config.default_technology
+        if "LNOI400" not in technology.name:
+            _warn.warn(_unsupported_technology_warning % technology.name, RuntimeWarning, 2)
+    return technology
+
+
+def _get_port_spec(port_spec, technology):
+    return technology.ports[port_spec] if isinstance(port_spec, str) else port_spec
+
+
 @_pf.parametric_component(name_prefix="MMI1x2")
 def mmi1x2(
     *,
@@ -43,22 +62,12 @@ def mmi1x2(
     if port_ratio * width < taper_width:
         _warn.warn("Waveguide tapers will overlap.", RuntimeWarning, 1)
 
-    if technology is None:
-        technology = _pf.config.default_technology
-        if "LNOI400" not in technology.name:
-            _warn.warn(
-                f"Current default technology {technology.name} does not seem supported by the "
-                "Luxtelligence LNOI400 component library.",
-                RuntimeWarning,
-                1,
-            )
-    if isinstance(port_spec, str):
-        port_spec = technology.ports[port_spec]
+    technology = _get_technology(technology)
+    port_spec = _get_port_spec(port_spec, technology)
 
     c = _pf.Component(name, technology=technology)
 
-    core_width, _, core_layer = min(p for p in port_spec.path_profiles if p[1] == 0)
-    clad_width, _, clad_layer = max(p for p in port_spec.path_profiles if p[1] == 0)
+    core_width, core_layer, clad_width, clad_layer = _core_clad(port_spec)
     margin = 0.5 * (clad_width - core_width)
 
     c.add(
@@ -68,20 +77,26 @@ def mmi1x2(
         _pf.Rectangle((0, -0.5 * width - margin), (length, 0.5 * width + margin)),
     )
 
+    # Collect all tapers to add them to the component in a single call
+    structures = []
     for layer, path in port_spec.get_paths((-taper_length, 0)):
         if layer == core_layer:
-            c.add(layer, path.segment((0, 0), taper_width))
+            path.segment((0, 0), taper_width)
         else:
-            c.add(layer, path.segment((0, 0)))
+            path.segment((0, 0))
+        structures.extend((layer, path))
 
+    # Output tapers are identical: create the top ones and translate copies to the bottom
     x = length + taper_length
     offset = width * port_ratio * 0.5
-    for y in (-offset, offset):
-        for layer, path in port_spec.get_paths((x, y)):
-            if layer == core_layer:
-                c.add(layer, path.segment((length, y), taper_width))
-            else:
-                c.add(layer, path.segment((length, y)))
+    for layer, path in port_spec.get_paths((x, offset)):
+        if layer == core_layer:
+            path.segment((length, offset), taper_width)
+        else:
+            path.segment((length, offset))
+        structures.extend((layer, path, layer, path.copy().translate((0, -2 * offset))))
+
+    c.add(*structures)
 
     c.add_port(_pf.Port((-taper_length, 0), 0, port_spec))
     c.add_port(_pf.Port((x, -offset), 180, port_spec, inverted=True))
@@ -128,22 +143,12 @@ def mmi2x2(
     if port_ratio * width < taper_width:
         _warn.warn("Waveguide tapers will overlap.", RuntimeWarning, 1)
 
-    if technology is None:
-        technology = _pf.config.default_technology
-        if "LNOI400" not in technology.name:
-            _warn.warn(
-                f"Current default technology {technology.name} does not seem supported by the "
-                "Luxtelligence LNOI400 component library.",
-                RuntimeWarning,
-                1,
-            )
-    if isinstance(port_spec, str):
-        port_spec = technology.ports[port_spec]
+    technology = _get_technology(technology)
+    port_spec = _get_port_spec(port_spec, technology)
 
     c = _pf.Component(name, technology=technology)
 
-    core_width, _, core_layer = min(p for p in port_spec.path_profiles if p[1] == 0)
-    clad_width, _, clad_layer = max(p for p in port_spec.path_profiles if p[1] == 0)
+    core_width, core_layer, clad_width, clad_layer = _core_clad(port_spec)
     margin = 0.5 * (clad_width - core_width)
 
     c.add(
@@ -153,21 +158,20 @@ def mmi2x2(
         _pf.Rectangle((0, -0.5 * width - margin), (length, 0.5 * width + margin)),
     )
 
+    # All tapers are identical: create the top ones on each side and translate copies to the
+    # bottom, adding them all to the component in a single call
+    structures = []
     offset = width * port_ratio * 0.5
-    for y in (-offset, offset):
-        for layer, path in port_spec.get_paths((-taper_length, y)):
-            if layer == core_layer:
-                c.add(layer, path.segment((0, y), taper_width))
-            else:
-                c.add(layer, path.segment((0, y)))
-
     x = length + taper_length
-    for y in (-offset, offset):
-        for layer, path in port_spec.get_paths((x, y)):
+    for x0, x1 in ((-taper_length, 0), (x, length)):
+        for layer, path in port_spec.get_paths((x0, offset)):
             if layer == core_layer:
-                c.add(layer, path.segment((length, y), taper_width))
+                path.segment((x1, offset), taper_width)
             else:
-                c.add(layer, path.segment((length, y)))
+                path.segment((x1, offset))
+            structures.extend((layer, path, layer, path.copy().translate((0, -2 * offset))))
+
+    c.add(*structures)
 
     c.add_port(_pf.Port((-taper_length, -offset), 0, port_spec))
     c.add_port(_pf.Port((-taper_length, offset), 0, port_spec))
@@ -214,31 +218,23 @@ def s_bend_vert(
             "S bend might be too tight. Make sure the geometry is correct.", RuntimeWarning, 1
         )
 
-    if technology is None:
-        technology = _pf.config.default_technology
-        if "LNOI400" not in technology.name:
-            _warn.warn(
-                f"Current default technology {technology.name} does not seem supported by the "
-                "Luxtelligence LNOI400 component library.",
-                RuntimeWarning,
-                1,
-            )
-    if isinstance(port_spec, str):
-        port_spec = technology.ports[port_spec]
+    technology = _get_technology(technology)
+    port_spec = _get_port_spec(port_spec, technology)
+
+    controls = _np.array(((h_extent / 3, 0), (h_extent * 2 / 3, v_offset), (h_extent, v_offset)))
+    endpoint = (h_extent + 2 * dx_straight, v_offset)
 
     c = _pf.Component(name, technology=technology)
     for layer, path in port_spec.get_paths((0, 0)):
         if dx_straight > 0:
             path.segment((dx_straight, 0))
-        path.bezier(
-            [(h_extent / 3, 0), (h_extent * 2 / 3, v_offset), (h_extent, v_offset)], relative=True
-        )
+        path.bezier(controls, relative=True)
         if dx_straight > 0:
-            path.segment((h_extent + 2 * dx_straight, v_offset))
+            path.segment(endpoint)
         c.add(layer, path)
 
     c.add_port(_pf.Port((0, 0), 0, port_spec))
-    c.add_port(_pf.Port((h_extent + 2 * dx_straight, v_offset), 180, port_spec, inverted=True))
+    c.add_port(_pf.Port(endpoint, 180, port_spec, inverted=True))
 
     c.add_model(_pf.Tidy3DModel(**tidy3d_model_kwargs), "Tidy3D")
     return c
@@ -270,17 +266,8 @@ def u_turn_bend(
     Returns:
         Component with the bend, ports and model.
     """
-    if technology is None:
-        technology = _pf.config.default_technology
-        if "LNOI400" not in technology.name:
-            _warn.warn(
-                f"Current default technology {technology.name} does not seem supported by the "
-                "Luxtelligence LNOI400 component library.",
-                RuntimeWarning,
-                1,
-            )
-    if isinstance(port_spec, str):
-        port_spec = technology.ports[port_spec]
+    technology = _get_technology(technology)
+    port_spec = _get_port_spec(port_spec, technology)
 
     c = _pf.Component(name, technology=technology)
 
@@ -324,17 +311,8 @@ def u_bend_racetrack(
     Returns:
         Component with the bend, ports and model.
     """
-    if technology is None:
-        technology = _pf.config.default_technology
-        if "LNOI400" not in technology.name:
-            _warn.warn(
-                f"Current default technology {technology.name} does not seem supported by the "
-                "Luxtelligence LNOI400 component library.",
-                RuntimeWarning,
-                1,
-            )
-    if isinstance(port_spec, str):
-        port_spec = technology.ports[port_spec]
+    technology = _get_technology(technology)
+    port_spec = _get_port_spec(port_spec, technology)
 
     c = _pf.Component(name, technology=technology)
 
@@ -382,17 +360,8 @@ def l_turn_bend(
     if effective_radius <= 0:
         raise ValueError("'radius' must be positive.")
 
-    if technology is None:
-        technology = _pf.config.default_technology
-        if "LNOI400" not in technology.name:
-            _warn.warn(
-                f"Current default technology {technology.name} does not seem supported by the "
-                "Luxtelligence LNOI400 component library.",
-                RuntimeWarning,
-                1,
-            )
-    if isinstance(port_spec, str):
-        port_spec = technology.ports[port_spec]
+    technology = _get_technology(technology)
+    port_spec = _get_port_spec(port_spec, technology)
 
     c = _pf.Component(name, technology=technology)
 
@@ -404,8 +373,7 @@ def l_turn_bend(
     c.add_port(_pf.Port((0, 0), 0, port_spec))
     c.add_port(_pf.Port(endpoint, -90, port_spec, inverted=True))
 
-    model_kwargs = {"port_symmetries": [("P0", "P1", {"P1": "P0"})]}
-    model_kwargs.update(tidy3d_model_kwargs)
+    model_kwargs = {"port_symmetries": [("P0", "P1", {"P1": "P0"})], **tidy3d_model_kwargs}
     c.add_model(_pf.Tidy3DModel(**model_kwargs), "Tidy3D")
     return c
 
@@ -438,21 +406,12 @@ def s_bend_var_width(
     Returns:
         Component with the S-bend, ports and model.
     """
-    if technology is None:
-        technology = _pf.config.default_technology
-        if "LNOI400" not in technology.name:
-            _warn.warn(
-                f"Current default technology {technology.name} does not seem supported by the "
-                "Luxtelligence LNOI400 component library.",
-                RuntimeWarning,
-                1,
-            )
-    if isinstance(port_spec, str):
-        port_spec = technology.ports[port_spec]
+    technology = _get_technology(technology)
+    port_spec = _get_port_spec(port_spec, technology)
 
     c = _pf.Component(name, technology=technology)
 
-    core_width, _, core_layer = min(p for p in port_spec.path_profiles if p[1] == 0)
+    core_width, _, _, _ = _core_clad(port_spec)
     dw = start_section_width - core_width
 
     start_port_spec = port_spec.copy()
@@ -479,9 +438,7 @@ def s_bend_var_width(
     c.add_port(_pf.Port((0, 0), 0, start_port_spec))
     c.add_port(_pf.Port((h_extent, v_offset), 180, port_spec, inverted=True))
 
-    model_kwargs = {}
-    model_kwargs.update(tidy3d_model_kwargs)
-    c.add_model(_pf.Tidy3DModel(**model_kwargs), "Tidy3D")
+    c.add_model(_pf.Tidy3DModel(**tidy3d_model_kwargs), "Tidy3D")
     return c
 
 
@@ -517,17 +474,8 @@ def dir_coupl(
     Returns:
         Component with the directional coupler, ports and model.
     """
-    if technology is None:
-        technology = _pf.config.default_technology
-        if "LNOI400" not in technology.name:
-            _warn.warn(
-                f"Current default technology {technology.name} does not seem supported by the "
-                "Luxtelligence LNOI400 component library.",
-                RuntimeWarning,
-                1,
-            )
-    if isinstance(port_spec, str):
-        port_spec = technology.ports[port_spec]
+    technology = _get_technology(technology)
+    port_spec = _get_port_spec(port_spec, technology)
 
     s_bend = s_bend_var_width(
         port_spec=port_spec,
@@ -606,19 +554,11 @@ def double_linear_inverse_taper(
     Returns:
         Component with the taper, ports and model.
     """
-    if technology is None:
-        technology = _pf.config.default_technology
-        if "LNOI400" not in technology.name:
-            _warn.warn(
-                f"Current default technology {technology.name} does not seem supported by the "
-                "Luxtelligence LNOI400 component library.",
-                RuntimeWarning,
-                1,
-            )
-    if isinstance(start_port_spec, str):
-        start_port_spec = technology.ports[start_port_spec]
-    if isinstance(end_port_spec, str):
-        end_port_spec = technology.ports[end_port_spec]
+    technology = _get_technology(technology)
+    start_port_spec = _get_port_spec(start_port_spec, technology)
+    end_port_spec = _get_port_spec(end_port_spec, technology)
+    if lower_taper_length <= 0:
+        raise ValueError("'lower_taper_length' must be positive.")
     if input_ext < 0:
         raise ValueError("'input_ext' may not be negative.")
     if slab_removal_width < 0:
@@ -626,15 +566,14 @@ def double_linear_inverse_taper(
 
     c = _pf.Component(name, technology=technology)
 
-    lower_taper_start_width = min(p[0] for p in start_port_spec.path_profiles if p[1] == 0)
-    upper_taper_end_width = min(p[0] for p in end_port_spec.path_profiles if p[1] == 0)
+    lower_taper_start_width, _, _, _ = _core_clad(start_port_spec)
+    upper_taper_end_width, _, _, _ = _core_clad(end_port_spec)
 
+    # The lower taper is extended with the same slope along the upper taper
+    length = lower_taper_length + upper_taper_length
     slope = (lower_taper_end_width - lower_taper_start_width) / lower_taper_length
-    lower_taper_end_width = lower_taper_start_width + slope * (
-        lower_taper_length + upper_taper_length
-    )
+    lower_taper_end_width = lower_taper_start_width + slope * length
 
-    length = lower_taper_length + upper_taper_length
     c.add(
         "LN_RIDGE",
         _pf.stencil.linear_taper(
@@ -657,8 +596,8 @@ def double_linear_inverse_taper(
         c.add(
             "SLAB_NEGATIVE",
             _pf.Rectangle(
-                center=(0.5 * (lower_taper_length + upper_taper_length - input_ext), 0),
-                size=(lower_taper_length + upper_taper_length + input_ext, slab_removal_width),
+                center=(0.5 * (length - input_ext), 0),
+                size=(length + input_ext, slab_removal_width),
             ),
         )
 
@@ -701,17 +640,8 @@ def cpw_probe_pad_linear(
     Returns:
         Component with the taper and port.
     """
-    if technology is None:
-        technology = _pf.config.default_technology
-        if "LNOI400" not in technology.name:
-            _warn.warn(
-                f"Current default technology {technology.name} does not seem supported by the "
-                "Luxtelligence LNOI400 component library.",
-                RuntimeWarning,
-                1,
-            )
-    if isinstance(port_spec, str):
-        port_spec = technology.ports[port_spec]
+    technology = _get_technology(technology)
+    port_spec = _get_port_spec(port_spec, technology)
 
     c = _pf.Component(name, technology=technology)
 
@@ -729,28 +659,32 @@ def cpw_probe_pad_linear(
             f"port specification."
         )
 
-    sig_vertices = [
-        (0, -scaling * y_sig),
-        (length_straight, -scaling * y_sig),
-        (length, -y_sig),
-        (length, y_sig),
-        (length_straight, scaling * y_sig),
-        (0, scaling * y_sig),
-    ]
-
-    gnd_vertices = [
-        (0, scaling * y_gnd),
-        (length_straight, scaling * y_gnd),
-        (length, y_gnd),
-        (length, y_max),
-        (0, y_max),
-    ]
+    sig_vertices = _np.array(
+        (
+            (0, -scaling * y_sig),
+            (length_straight, -scaling * y_sig),
+            (length, -y_sig),
+            (length, y_sig),
+            (length_straight, scaling * y_sig),
+            (0, scaling * y_sig),
+        )
+    )
+
+    gnd_vertices = _np.array(
+        (
+            (0, scaling * y_gnd),
+            (length_straight, scaling * y_gnd),
+            (length, y_gnd),
+            (length, y_max),
+            (0, y_max),
+        )
+    )
 
     c.add(
         layer,
         _pf.Polygon(sig_vertices),
         _pf.Polygon(gnd_vertices),
-        _pf.Polygon([(x, -y) for x, y in gnd_vertices]),
+        _pf.Polygon(gnd_vertices * (1, -1)),
     )
 
     c.add_port(_pf.Port((length, 0), 180, port_spec, inverted=True))
@@ -810,24 +744,15 @@ def eo_phase_shifter(
     if modulation_length <= 2 * taper_length:
         raise ValueError("'modulation_length' must be larger than '2 * taper_length'.")
 
-    if technology is None:
-        technology = _pf.config.default_technology
-        if "LNOI400" not in technology.name:
-            _warn.warn(
-                f"Current default technology {technology.name} does not seem supported by the "
-                "Luxtelligence LNOI400 component library.",
-                RuntimeWarning,
-                1,
-            )
-    if isinstance(port_spec, str):
-        port_spec = technology.ports[port_spec]
-    if isinstance(tl_port_spec, str):
-        tl_port_spec = technology.ports[tl_port_spec]
-
-    core_width, _, _ = min(port_spec.path_profiles)
+    technology = _get_technology(technology)
+    port_spec = _get_port_spec(port_spec, technology)
+    tl_port_spec = _get_port_spec(tl_port_spec, technology)
+
+    path_profiles = port_spec.path_profiles
+    core_width = min(w for w, _, _ in path_profiles)
     added_width = rib_core_width_modulator - core_width
     mod_spec = port_spec.copy()
-    mod_spec.path_profiles = {(w + added_width, g, a) for w, g, a in port_spec.path_profiles}
+    mod_spec.path_profiles = tuple((w + added_width, g, a) for w, g, a in path_profiles)
 
     taper = _pf.parametric.transition(
         port_spec1=port_spec, port_spec2=mod_spec, length=taper_length, technology=technology
@@ -858,6 +783,16 @@ def eo_phase_shifter(
     return c
 
 
+def _add_chain(component, reference, port, segments):
+    for segment, input_port, output_port, mirror in segments:
+        new_reference = component.add_reference(segment)
+        if mirror:
+            new_reference.mirror()
+        reference = new_reference.connect(input_port, reference[port])
+        port = output_port
+    return reference
+
+
 @_pf.parametric_component(name_prefix="MZM")
 def mz_modulator_unbalanced(
     *,
@@ -892,7 +827,9 @@ def mz_modulator_unbalanced(
         modulation_length: Length of the phase modulation section.
         length_imbalance: Length difference between the two arms of the MZI.
         bias_tuning_section_length: Length of the horizontal section that
-          can be used for phase tuning.
+          can be used for phase tuning. Must not be negative. If 0, the
+          section is removed and the bends on either side are connected
+          directly.
         rf_pad_start_width: Width of the central conductor on the pad side.
         rf_pad_length_straight: Length of the straight section of the taper
           on the pad side.
@@ -911,31 +848,24 @@ def mz_modulator_unbalanced(
         raise ValueError("'taper_length' must be positive.")
     if modulation_length <= 2 * taper_length:
         raise ValueError("'modulation_length' must be larger than '2 * taper_length'.")
+    if bias_tuning_section_length < 0:
+        raise ValueError("'bias_tuning_section_length' may not be negative.")
 
-    if technology is None:
-        technology = _pf.config.default_technology
-        if "LNOI400" not in technology.name:
-            _warn.warn(
-                f"Current default technology {technology.name} does not seem supported by the "
-                "Luxtelligence LNOI400 component library.",
-                RuntimeWarning,
-                1,
-            )
+    technology = _get_technology(technology)
 
-    if isinstance(tl_port_spec, str):
-        tl_port_spec = technology.ports[tl_port_spec]
+    tl_port_spec = _get_port_spec(tl_port_spec, technology)
+    central_width, tl_gap, _, _, _ = _cpw_info(tl_port_spec)
+    phase_shifters_distance = central_width + tl_gap
 
+    # The default splitter is only built after all arguments have been validated
     if splitter is None:
         splitter = mmi1x2(technology=technology)
 
-    splitter_ports = sorted(splitter.ports.items())
+    splitter_ports = _sorted_ports(splitter)
     if len(splitter_ports) < 3:
         raise TypeError("'splitter' is expected to be a component with 3 ports.")
     port_spec = splitter_ports[0][1].spec
     splitter_port_distance = abs(splitter_ports[2][1].center[1] - splitter_ports[1][1].center[1])
-
-    central_width, tl_gap, _, _, _ = _cpw_info(tl_port_spec)
-    phase_shifters_distance = central_width + tl_gap
     phase_shifter = eo_phase_shifter(
         port_spec=port_spec,
         tl_port_spec=tl_port_spec,
@@ -947,37 +877,57 @@ def mz_modulator_unbalanced(
     )
 
     scaling = rf_pad_start_width / central_width
-    pad_gap_distance = scaling * (central_width + tl_gap)
+    pad_gap_distance = scaling * phase_shifters_distance
+    # S bends without vertical offset are replaced by equivalent straight sections
+    input_s_straight = 5.0
     input_s_offset = 0.5 * (pad_gap_distance - splitter_port_distance)
-    input_s_bend = s_bend_vert(
-        port_spec=port_spec,
-        h_extent=input_s_offset * 3.6,
-        v_offset=input_s_offset,
-        dx_straight=5.0,
-        technology=technology,
-    )
+    if abs(input_s_offset) < _pf.config.tolerance:
+        input_s_bend = _pf.parametric.straight(
+            port_spec=port_spec, length=2 * input_s_straight, technology=technology
+        )
+    else:
+        input_s_bend = s_bend_vert(
+            port_spec=port_spec,
+            h_extent=input_s_offset * 3.6,
+            v_offset=input_s_offset,
+            dx_straight=input_s_straight,
+            technology=technology,
+        )
 
+    # Straight sections take half of the pad straight length, so the bend spans the tapered length
     pad_s_straight = rf_pad_length_straight * 0.5
     pad_s_offset = 0.5 * (phase_shifters_distance - pad_gap_distance)
-    pad_s_bend = s_bend_vert(
-        port_spec=port_spec,
-        h_extent=rf_pad_length_straight + rf_pad_length_tapered - 2 * pad_s_straight,
-        v_offset=pad_s_offset,
-        dx_straight=pad_s_straight,
-        technology=technology,
-    )
+    if abs(pad_s_offset) < _pf.config.tolerance:
+        pad_s_bend = _pf.parametric.straight(
+            port_spec=port_spec,
+            length=rf_pad_length_tapered + 2 * pad_s_straight,
+            technology=technology,
+        )
+    else:
+        pad_s_bend = s_bend_vert(
+            port_spec=port_spec,
+            h_extent=rf_pad_length_tapered,
+            v_offset=pad_s_offset,
+            dx_straight=pad_s_straight,
+            technology=technology,
+        )
 
     bend = l_turn_bend(
         port_spec=port_spec, effective_radius=75, euler_fraction=1.0, technology=technology
     )
 
     short_length = 20.0
-    long_straight = _pf.parametric.straight(
-        port_spec=port_spec, length=short_length + abs(length_imbalance) / 2, technology=technology
-    )
     short_straight = _pf.parametric.straight(
         port_spec=port_spec, length=short_length, technology=technology
     )
+    if length_imbalance == 0:
+        long_straight = short_straight
+    else:
+        long_straight = _pf.parametric.straight(
+            port_spec=port_spec,
+            length=short_length + abs(length_imbalance) / 2,
+            technology=technology,
+        )
     if length_imbalance > 0:
         top_straight = long_straight
         bot_straight = short_straight
@@ -985,43 +935,63 @@ def mz_modulator_unbalanced(
         top_straight = short_straight
         bot_straight = long_straight
 
-    bias_straight = _pf.parametric.straight(
-        port_spec=port_spec, length=bias_tuning_section_length, technology=technology
-    )
+    bias_straight = None
+    if bias_tuning_section_length > 0:
+        bias_straight = _pf.parametric.straight(
+            port_spec=port_spec, length=bias_tuning_section_length, technology=technology
+        )
 
     c = _pf.Component(name, technology=technology)
     ps_top = _pf.Reference(phase_shifter)
     ps_bot = _pf.Reference(phase_shifter, (0, -phase_shifters_distance))
     c.add(ps_top, ps_bot)
 
+    # Each chain segment is (component, input port, output port, mirror); the input port of each
+    # segment is connected to the output port of the previous one
+    bias_segments = () if bias_straight is None else ((bias_straight, "P0", "P1", False),)
+
     # Input side, top
-    r_top = c.add_reference(pad_s_bend).connect("P1", ps_top["P0"])
-    r_top = c.add_reference(input_s_bend).connect("P1", r_top["P0"])
+    r_top = _add_chain(
+        c, ps_top, "P0", ((pad_s_bend, "P1", "P0", False), (input_s_bend, "P1", "P0", False))
+    )
 
     r_input = c.add_reference(splitter).connect(splitter_ports[2][0], r_top["P0"])
     c.add_port(r_input[splitter_ports[0][0]])
 
     # Input side, bottom
-    r_bot = c.add_reference(pad_s_bend).mirror().connect("P1", ps_bot["P0"])
-    r_bot = c.add_reference(input_s_bend).mirror().connect("P1", r_bot["P0"])
+    _add_chain(c, ps_bot, "P0", ((pad_s_bend, "P1", "P0", True), (input_s_bend, "P1", "P0", True)))
 
     # Output side, top
-    r_top = c.add_reference(pad_s_bend).mirror().connect("P0", ps_top["P1"])
-    r_top = c.add_reference(bend).connect("P0", r_top["P1"])
-    r_top = c.add_reference(top_straight).connect("P0", r_top["P1"])
-    r_top = c.add_reference(bend).connect("P1", r_top["P1"])
-    r_top = c.add_reference(bias_straight).connect("P0", r_top["P0"])
-    r_top = c.add_reference(bend).connect("P1", r_top["P1"])
-    r_top = c.add_reference(top_straight).connect("P0", r_top["P0"])
+    r_top = _add_chain(
+        c,
+        ps_top,
+        "P1",
+        (
+            (pad_s_bend, "P0", "P1", True),
+            (bend, "P0", "P1", False),
+            (top_straight, "P0", "P1", False),
+            (bend, "P1", "P0", False),
+            *bias_segments,
+            (bend, "P1", "P0", False),
+            (top_straight, "P0", "P1", False),
+        ),
+    )
 
     # Output side, bottom
-    r_bot = c.add_reference(pad_s_bend).connect("P0", ps_bot["P1"])
-    r_bot = c.add_reference(bend).connect("P1", r_bot["P1"])
-    r_bot = c.add_reference(bot_straight).connect("P0", r_bot["P0"])
-    r_bot = c.add_reference(bend).connect("P0", r_bot["P1"])
-    r_bot = c.add_reference(bias_straight).connect("P0", r_bot["P1"])
-    r_bot = c.add_reference(bend).connect("P0", r_bot["P1"])
-    r_bot = c.add_reference(bot_straight).connect("P0", r_bot["P1"])
+    r_bot = _add_chain(
+        c,
+        ps_bot,
+        "P1",
+        (
+            (pad_s_bend, "P0", "P1", False),
+            (bend, "P1", "P0", False),
+            (bot_straight, "P0", "P1", False),
+            (bend, "P0", "P1", False),
+            *bias_segments,
+            (bend, "P0", "P1", False),
+            (bot_straight, "P0", "P1", False),
+        ),
+    )
 
     out_bend = l_turn_bend(
         port_spec=port_spec,
@@ -1065,6 +1035,10 @@ def mz_modulator_unbalanced(
     return c
 
 
+# Nominal and actual chip dimensions
+_chip_sizes = {5000: 5050, 5050: 5050, 10000: 10100, 10100: 10100, 20000: 20200, 20200: 20200}
+
+
 @_pf.parametric_component(name_prefix="CHIP_FRAME")
 def chip_frame(
     *,
@@ -1095,29 +1069,14 @@ def chip_frame(
     Returns:
         Component with chip frame.
     """
-    if technology is None:
-        technology = _pf.config.default_technology
-        if "LNOI400" not in technology.name:
-            _warn.warn(
-                f"Current default technology {technology.name} does not seem supported by the "
-                "Luxtelligence LNOI400 component library.",
-                RuntimeWarning,
-                1,
-            )
-
-    if x_size < 10000:
-        x_size = 5050
-    elif x_size < 20000:
-        x_size = 10100
-    else:
-        x_size = 20200
+    technology = _get_technology(technology)
 
-    if y_size < 10000:
-        y_size = 5050
-    elif y_size < 20000:
-        y_size = 10100
-    else:
-        y_size = 20200
+    if x_size not in _chip_sizes:
+        raise ValueError("'x_size' must be one of " + ", ".join(str(s) for s in _chip_sizes))
+    if y_size not in _chip_sizes:
+        raise ValueError("'y_size' must be one of " + ", ".join(str(s) for s in _chip_sizes))
+    x_size = _chip_sizes[x_size]
+    y_size = _chip_sizes[y_size]
 
     if x_size == 5050 and y_size == 5050:
         raise ValueError("The minimal die size is 5050 μm × 10100 μm.")
@@ -1161,15 +1120,7 @@ def heater_pad(
     Returns:
         Component with the bonding pad centered at the origin.
     """
-    if technology is None:
-        technology = _pf.config.default_technology
-        if "LNOI400" not in technology.name:
-            _warn.warn(
-                f"Current default technology {technology.name} does not seem supported by the "
-                "Luxtelligence LNOI400 component library.",
-                RuntimeWarning,
-                1,
-            )
+    technology = _get_technology(technology)
 
     c = _pf.Component(name, technology=technology)
 
@@ -1182,7 +1133,7 @@ def heater_pad(
     x2 = x0 + taper_length
     y2 = 0.5 * contact_width
     polygon = _pf.Polygon(
-        [(x0, y0), (-x0, y0), (-x0, -y0), (x0, -y0), (x0, -y1), (x2, -y2), (x2, y2), (x0, y1)]
+        ((x0, y0), (-x0, y0), (-x0, -y0), (x0, -y0), (x0, -y1), (x2, -y2), (x2, y2), (x0, y1))
     )
     layer = technology.layers["HT"].layer
     c.add(layer, polygon)
@@ -1220,15 +1171,7 @@ def heater_straight(
     Returns:
         Component with heater and bonding pads.
     """
-    if technology is None:
-        technology = _pf.config.default_technology
-        if "LNOI400" not in technology.name:
-            _warn.warn(
-                f"Current default technology {technology.name} does not seem supported by the "
-                "Luxtelligence LNOI400 component library.",
-                RuntimeWarning,
-                1,
-            )
+    technology = _get_technology(technology)
 
     contact_width = 3 * heater_width
 
@@ -1294,17 +1237,8 @@ def heated_straight_waveguide(
     Returns:
         Component with the waveguide, heater, ports and model.
     """
-    if technology is None:
-        technology = _pf.config.default_technology
-        if "LNOI400" not in technology.name:
-            _warn.warn(
-                f"Current default technology {technology.name} does not seem supported by the "
-                "Luxtelligence LNOI400 component library.",
-                RuntimeWarning,
-                1,
-            )
-    if isinstance(port_spec, str):
-        port_spec = technology.ports[port_spec]
+    technology = _get_technology(technology)
+    port_spec = _get_port_spec(port_spec, technology)
 
     c = _pf.Component(name, technology=technology)
 
@@ -1327,7 +1261,6 @@ def heated_straight_waveguide(
     c.add_port(straight["P0"], "P0")
     c.add_port(straight["P1"], "P1")
 
-    model_kwargs = {"port_symmetries": [("P0", "P1", {"P1": "P0"})]}
-    model_kwargs.update(tidy3d_model_kwargs)
+    model_kwargs = {"port_symmetries": [("P0", "P1", {"P1": "P0"})], **tidy3d_model_kwargs}
     c.add_model(_pf.Tidy3DModel(**model_kwargs), "Tidy3D")
     return c
@@ -20,6 +20,7 @@ def _cpw_info(port_spec):
     if (
         central_profile is None
         or ground_profile is None
+        or central_profile[0] <= 0
         or central_profile[2] != ground_profile[2]
         or not port_spec.symmetric()
         or len(path_profiles) != 3
@@ -35,6 +36,31 @@ def _cpw_info(port_spec):
     return central_width, gap, ground_width, ground_offset, layer
 
 
+def _core_clad(port_spec):
+    path_profiles = port_spec.path_profiles
+    if isinstance(path_profiles, dict):
+        path_profiles = list(path_profiles.values())
+
+    core_profile = None
+    clad_profile = None
+    for profile in path_profiles:
+        if profile[1] != 0:
+            continue
+        if core_profile is None or profile < core_profile:
+            core_profile = profile
+        if clad_profile is None or profile > clad_profile:
+            clad_profile = profile
+
+    if core_profile is None:
+        raise RuntimeError("Port specification does not contain any centered path profile.")
+
+    return core_profile[0], core_profile[2], clad_profile[0], clad_profile[2]
+
+
+def _sorted_ports(component):
+    return sorted(component.ports.items())
+
+
 _sides = ["N", "NORTH", "W", "WEST", "E", "EAST", "S", "SOUTH"]
 
 
@@ -81,7 +107,7 @@ def place_edge_couplers(
 
         coupler = double_linear_inverse_taper()
 
-    ports = sorted(coupler.ports.items())
+    ports = _sorted_ports(coupler)
     port = ports[0][1]
 
     frame = pf.envelope(chip_frame.get_structures((6, 1), 0), use_box=True)
@@ -16,67 +16,65 @@ def hex_to_rgba(color):
         color = color[1:]
 
     n = len(color)
-    if n == 3:  # "RGB"
-        return tuple(int(c * 2, 16) for c in color) + (255,)
-    if n == 4:  # "RGBA"
-        return tuple(int(c * 2, 16) for c in color)
-    if n == 6:  # "RRGGBB"
-        return tuple(int(color[i : i + 2], 16) for i in (0, 2, 4)) + (255,)
-    if n == 8:  # "RRGGBBAA"
-        return tuple(int(color[i : i + 2], 16) for i in (0, 2, 4, 6))
-    raise ValueError("Argument not recognized as a hex-valued RGBA color.")
-
-
-# Klayout patterns
-patterns = {
-    "0": "solid",  # solid
-    "1": "hollow",  # hollow
-    "2": ":",  # dotted
-    "3": ".",  # coarsely dotted
-    "4": "\\\\",  # left-hatched
-    "5": "\\",  # lightly left-hatched
-    "6": "\\\\",  # strongly left-hatched dense
-    "7": "\\",  # strongly left-hatched sparse
-    "8": "//",  # right-hatched
-    "9": "/",  # lightly right-hatched
-    "10": "//",  # strongly right-hatched dense
-    "11": "/",  # strongly right-hatched sparse
-    "12": "xx",  # cross-hatched
-    "13": "x",  # lightly cross-hatched
-    "14": "+",  # checkerboard 2px
-    "15": "x",  # strongly cross-hatched sparse
-    "16": "xx",  # heavy checkerboard
-    "17": "x",  # hollow bubbles
-    "18": "x",  # solid bubbles
-    "19": "+",  # pyramids
-    "20": "+",  # turned pyramids
-    "21": "+",  # plus
-    "22": "-",  # minus
-    "23": "/",  # 22.5 degree down
-    "24": "\\",  # 22.5 degree up
-    "25": "//",  # 67.5 degree down
-    "26": "\\\\",  # 67.5 degree up
-    "27": "x",  # 22.5 cross hatched
-    "28": "x",  # zig zag
-    "29": "x",  # sine
-    "30": "+",  # special pattern for light heavy dithering
-    "31": "+",  # special pattern for light frame dithering
-    "32": "||",  # vertical dense
-    "33": "|",  # vertical
-    "34": "||",  # vertical thick
-    "35": "|",  # vertical sparse
-    "36": "|",  # vertical sparse, thick
-    "37": "=",  # horizontal dense
-    "38": "-",  # horizontal
-    "39": "=",  # horizontal thick
-    "40": "-",  # horizontal
-    "41": "-",  # horizontal
-    "42": "++",  # grid dense
-    "43": "+",  # grid
-    "44": "++",  # grid thick
-    "45": "+",  # grid sparse
-    "46": "+",  # grid sparse, thick
-}
+    if n == 3 or n == 4:  # "RGB" or "RGBA"
+        color = "".join(c * 2 for c in color)
+    elif n != 6 and n != 8:  # "RRGGBB" or "RRGGBBAA"
+        raise ValueError("Argument not recognized as a hex-valued RGBA color.")
+
+    rgba = tuple(bytes.fromhex(color))
+    return rgba if len(rgba) == 4 else rgba + (255,)
+
+
+# Klayout patterns, indexed by dither pattern number
+patterns = (
+    "solid",  # 0: solid
+    "hollow",  # 1: hollow
+    ":",  # 2: dotted
+    ".",  # 3: coarsely dotted
+    "\\\\",  # 4: left-hatched
+    "\\",  # 5: lightly left-hatched
+    "\\\\",  # 6: strongly left-hatched dense
+    "\\",  # 7: strongly left-hatched sparse
+    "//",  # 8: right-hatched
+    "/",  # 9: lightly right-hatched
+    "//",  # 10: strongly right-hatched dense
+    "/",  # 11: strongly right-hatched sparse
+    "xx",  # 12: cross-hatched
+    "x",  # 13: lightly cross-hatched
+    "+",  # 14: checkerboard 2px
+    "x",  # 15: strongly cross-hatched sparse
+    "xx",  # 16: heavy checkerboard
+    "x",  # 17: hollow bubbles
+    "x",  # 18: solid bubbles
+    "+",  # 19: pyramids
+    "+",  # 20: turned pyramids
+    "+",  # 21: plus
+    "-",  # 22: minus
+    "/",  # 23: 22.5 degree down
+    "\\",  # 24: 22.5 degree up
+    "//",  # 25: 67.5 degree down
+    "\\\\",  # 26: 67.5 degree up
+    "x",  # 27: 22.5 cross hatched
+    "x",  # 28: zig zag
+    "x",  # 29: sine
+    "+",  # 30: special pattern for light heavy dithering
+    "+",  # 31: special pattern for light frame dithering
+    "||",  # 32: vertical dense
+    "|",  # 33: vertical
+    "||",  # 34: vertical thick
+    "|",  # 35: vertical sparse
+    "|",  # 36: vertical sparse, thick
+    "=",  # 37: horizontal dense
+    "-",  # 38: horizontal
+    "=",  # 39: horizontal thick
+    "-",  # 40: horizontal
+    "-",  # 41: horizontal
+    "++",  # 42: grid dense
+    "+",  # 43: grid
+    "++",  # 44: grid thick
+    "+",  # 45: grid sparse
+    "+",  # 46: grid sparse, thick
+)
 
 descriptions = {
     (2, 0): "LN etch (ridge)",
@@ -95,23 +93,34 @@ names = {
     (31, 0): "ALIGN",
 }
 
-tree = et.parse(f"{pdk}/lnoi.lyp")
-root = tree.getroot()
+
+def top_level_properties(path):
+    "Stream the top-level layer properties from a KLayout layer properties file"
+    depth = 0
+    for event, element in et.iterparse(path, ("start", "end")):
+        if event == "start":
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 1 and element.tag == "properties":
+            yield element
+            element.clear()
+
 
 print("    layers = {")
-for prop in root.findall("properties"):
-    text = prop.find("source").text
+for prop in top_level_properties(f"{pdk}/lnoi.lyp"):
+    text = prop.findtext("source")
     if text == "*/*":
         continue
     j = text.find("/")
     k = j + text[j:].find("@")
     layer = (int(text[:j]), int(text[j + 1 : k]))
-    color = prop.find("fill-color").text + "18"
-    pattern = patterns[prop.find("dither-pattern").text[1:]]
+    color = prop.findtext("fill-color") + "18"
+    pattern = patterns[int(prop.findtext("dither-pattern")[1:])]
     desc = descriptions[layer]
 
-    name = prop.find("name").text
-    if name is None:
+    name = prop.findtext("name")
+    if not name:
         name = names[layer]
     else:
         name = name.strip()
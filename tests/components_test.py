@@ -1,7 +1,16 @@
+import collections
+import inspect
+
+import numpy
+import pytest
 import photonforge as pf
 import luxtelligence_lnoi400_forge as lxt
 
 
+def _total_area(structures):
+    return numpy.fromiter((s.area() for s in structures), float, len(structures)).sum()
+
+
 def test_components():
     technology = lxt.lnoi400()
     for name in dir(lxt.component):
@@ -11,7 +20,7 @@ def test_components():
         _ = func(technology=technology)
 
 
-def test_defaults(request):
+def test_defaults(reference_gdsii):
     pf.config.default_technology = lxt.lnoi400()
     for component in [
         getattr(lxt.component, n)() for n in dir(lxt.component) if not n.startswith("_")
@@ -22,30 +31,28 @@ def test_defaults(request):
         elif name == "UBEND":
             name = ""
 
-        path = request.path.parent / "gdsii" / f"{name}.gds"
-        if not path.is_file():
+        gdsii = reference_gdsii.get(name)
+        if gdsii is None:
             continue
 
-        gdsii = pf.find_top_level(*pf.load_layout(path).values())
-        assert len(gdsii) == 1
-        gdsii = gdsii[0]
-
         diff = pf.Component(component.name + ".diff")
         total = 0
         error = 0
-        for layer in component.layers(include_dependencies=True) + gdsii.layers(
-            include_dependencies=True
-        ):
+        # Layers present in both components are weighted twice, as the thresholds below
+        # were set with that weighting.
+        layers = collections.Counter(
+            component.layers(include_dependencies=True) + gdsii.layers(include_dependencies=True)
+        )
+        for layer, count in layers.items():
             gdsii_structs = gdsii.get_structures(layer)
             diff_structs = pf.offset(
                 pf.boolean(component.get_structures(layer), gdsii_structs, "^"),
                 -pf.config.tolerance,
             )
-            if len(gdsii_structs) > 0:
-                total += sum(x.area() for x in gdsii_structs)
+            total += count * _total_area(gdsii_structs)
             if len(diff_structs) > 0:
                 diff.add(layer, *diff_structs)
-                error += sum(x.area() for x in diff_structs)
+                error += count * _total_area(diff_structs)
 
         valid = error / total < {
             "DIR_COUPL": 0.059,
@@ -57,3 +64,101 @@ def test_defaults(request):
         if not valid:
             diff.write_gds()
             assert False, f"{component.name} error: {error / total:g}"
+
+
+def test_mzm_without_imbalance_or_bias_section():
+    technology = lxt.lnoi400()
+    mzm = lxt.component.mz_modulator_unbalanced(length_imbalance=0, technology=technology)
+    no_bias = lxt.component.mz_modulator_unbalanced(
+        length_imbalance=0, bias_tuning_section_length=0, technology=technology
+    )
+    assert len(no_bias.ports) == 2
+    ports = sorted(mzm.ports.values(), key=lambda port: port.center[0])
+    no_bias_ports = sorted(no_bias.ports.values(), key=lambda port: port.center[0])
+    assert tuple(no_bias_ports[0].center) == pytest.approx(tuple(ports[0].center))
+    # The bias section runs horizontally, so the output moves back by its default length
+    assert tuple(no_bias_ports[1].center) == pytest.approx(tuple(ports[1].center - (700.0, 0)))
+
+    with pytest.raises(ValueError):
+        lxt.component.mz_modulator_unbalanced(
+            bias_tuning_section_length=-1.0, technology=technology
+        )
+
+
+def test_mzm_technology_update():
+    technology = lxt.lnoi400()
+    port_spec = technology.ports["RWG1000"].copy()
+    port_spec.width += 1
+    mzm = lxt.component.mz_modulator_unbalanced(technology=technology)
+    assert all(port.spec != port_spec for port in mzm.ports.values())
+
+    technology.add_port("RWG1000", port_spec)
+    mzm = lxt.component.mz_modulator_unbalanced(technology=technology)
+    assert all(port.spec == port_spec for port in mzm.ports.values())
+    splitter = lxt.component.mmi1x2(technology=technology)
+    assert splitter.ports["P0"].spec == port_spec
+    assert any(reference.component == splitter for reference in mzm.references)
+
+
+def test_mzm_s_bends_without_offset():
+    technology = lxt.lnoi400()
+    signal_width, gap, _, _, _ = lxt.utils._cpw_info(technology.ports["UniCPW-EO"])
+    phase_shifters_distance = signal_width + gap
+    splitter = lxt.component.mmi1x2(technology=technology)
+    splitter_port_distance = abs(splitter.ports["P2"].center[1] - splitter.ports["P1"].center[1])
+    parameters = inspect.signature(lxt.component.mz_modulator_unbalanced).parameters
+    default_width = parameters["rf_pad_start_width"].default
+
+    def input_s_offset(rf_pad_start_width):
+        pad_gap_distance = rf_pad_start_width / signal_width * phase_shifters_distance
+        return 0.5 * (pad_gap_distance - splitter_port_distance)
+
+    def input_port_center(rf_pad_start_width):
+        mzm = lxt.component.mz_modulator_unbalanced(
+            rf_pad_start_width=rf_pad_start_width, draw_cpw=False, technology=technology
+        )
+        return min(mzm.ports.values(), key=lambda port: port.center[0]).center
+
+    x_default, y_default = input_port_center(default_width)
+
+    # Without offset in the pad section, then without offset in the input section. The straight
+    # sections must span the same length as the S bends they replace, whose horizontal extent
+    # grows by 3.6 times the input offset.
+    for rf_pad_start_width in (
+        signal_width,
+        signal_width * splitter_port_distance / phase_shifters_distance,
+    ):
+        x = x_default + 3.6 * (
+            abs(input_s_offset(default_width)) - abs(input_s_offset(rf_pad_start_width))
+        )
+        center = input_port_center(rf_pad_start_width)
+        assert tuple(center) == pytest.approx((x, y_default))
+
+
+def test_double_linear_inverse_taper_lengths():
+    technology = lxt.lnoi400()
+    with pytest.raises(ValueError):
+        lxt.component.double_linear_inverse_taper(lower_taper_length=0, technology=technology)
+
+
+def test_cpw_central_width():
+    technology = lxt.lnoi400()
+    for central_width in (0.0, -10.0):
+        port_spec = technology.ports["UniCPW-EO"].copy()
+        port_spec.path_profiles = {
+            name: (central_width if offset == 0 else width, offset, layer)
+            for name, (width, offset, layer) in port_spec.path_profiles.items()
+        }
+        with pytest.raises(RuntimeError):
+            lxt.component.cpw_probe_pad_linear(port_spec=port_spec, technology=technology)
+
+
+def test_chip_frame_sizes():
+    technology = lxt.lnoi400()
+    frame = lxt.component.chip_frame(x_size=10000, y_size=5000, technology=technology)
+    lo, hi = frame.bounds()
+    assert tuple(hi - lo) == (10100, 5050)
+    with pytest.raises(ValueError):
+        lxt.component.chip_frame(x_size=7000, technology=technology)
+    with pytest.raises(ValueError):
+        lxt.component.chip_frame(x_size=5000, y_size=5050, technology=technology)
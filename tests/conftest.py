@@ -0,0 +1,14 @@
+import pathlib
+
+import pytest
+import photonforge as pf
+
+
+@pytest.fixture(scope="session")
+def reference_gdsii():
+    references = {}
+    for path in (pathlib.Path(__file__).parent / "gdsii").glob("*.gds"):
+        top_level = pf.find_top_level(*pf.load_layout(path).values())
+        assert len(top_level) == 1
+        references[path.stem] = top_level[0]
+    return references
@@ -3,11 +3,14 @@ import re
 import luxtelligence_lnoi400_forge as lxt
 
 
+_version_re = re.compile('version = "([^"]*)"')
+
+
 def test_version():
     assert isinstance(lxt.__version__, str)
     assert lxt.__version__ == lxt.lnoi400().version
     pyproject = pathlib.Path("pyproject.toml")
     if pyproject.is_file():
         contents = pyproject.read_text()
-        match = re.search('version = "([^"]*)"', contents)
+        match = _version_re.search(contents)
         assert match and match.groups(1)[0] == lxt.__version__